@@ -3,6 +3,8 @@
 from flask import Flask
 from .config import get_config
 from .database import close_db, init_db
+from .json_provider import OrjsonProvider
+from .static_assets import init_static
 from .routes import health, users, songs, quiz, playlists, frontend
 from .routes.metrics import init_metrics
 
@@ -27,6 +29,9 @@ def create_app(config_name=None):
     config = get_config(config_name)
     app.config.from_object(config)
 
+    # Serialize JSON responses with orjson
+    app.json = OrjsonProvider(app)
+
     # Register database teardown
     app.teardown_appcontext(close_db)
 
@@ -42,6 +47,12 @@ def create_app(config_name=None):
     app.register_blueprint(playlists.bp, url_prefix="/api/playlists")
     app.register_blueprint(frontend.bp)
     
+    # Content-versioned static URLs with long-lived caching
+    init_static(app)
+    
+    # Render the frontend pages before gunicorn forks its workers
+    frontend.warm_pages(app)
+    
     # Initialize metrics (Prometheus)
     init_metrics(app)
     
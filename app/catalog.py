@@ -0,0 +1,89 @@
+"""In-memory copy of the song catalog.
+
+The songs table is only written when the database is seeded, so it is
+loaded once by ``init_db`` and read paths are served from memory. The
+cached rows are shared between requests and must be treated as read-only.
+"""
+
+import sqlite3
+from operator import itemgetter
+from typing import List, Dict, Any, Optional
+
+# All songs in id order
+SONGS: List[Dict[str, Any]] = []
+
+# Songs keyed by id
+SONGS_BY_ID: Dict[int, Dict[str, Any]] = {}
+
+# Songs grouped by subgenre, each list in id order
+SONGS_BY_SUBGENRE: Dict[str, List[Dict[str, Any]]] = {}
+
+# (id, title, artist) rows ordered by title
+SONG_TITLES: List[Dict[str, Any]] = []
+
+# Casefolded "title\0artist" text keyed by song id, for substring search
+SEARCH_TEXT: Dict[int, str] = {}
+
+
+def load_catalog(conn: sqlite3.Connection) -> None:
+    """
+    Load (or reload) the catalog from the songs table.
+
+    Args:
+        conn: Database connection
+    """
+    cursor = conn.execute("SELECT * FROM songs ORDER BY id")
+    columns = [col[0] for col in cursor.description]
+    songs = [dict(zip(columns, row, strict=True)) for row in cursor]
+
+    # Update in place so modules holding a reference see the new data
+    SONGS[:] = songs
+    SONGS_BY_ID.clear()
+    SONGS_BY_ID.update((song["id"], song) for song in songs)
+    SONGS_BY_SUBGENRE.clear()
+    for song in songs:
+        SONGS_BY_SUBGENRE.setdefault(song["subgenre"], []).append(song)
+    SONG_TITLES[:] = [
+        {"id": song["id"], "title": song["title"], "artist": song["artist"]}
+        for song in sorted(songs, key=itemgetter("title"))
+    ]
+    SEARCH_TEXT.clear()
+    SEARCH_TEXT.update(
+        (song["id"], f"{song['title']}\0{song['artist']}".casefold()) for song in songs
+    )
+
+
+def get_all_songs(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """
+    Get all songs, loading the catalog on first use.
+
+    Args:
+        conn: Database connection used if the catalog is not loaded yet
+
+    Returns:
+        Shared list of song dicts
+    """
+    if not SONGS:
+        load_catalog(conn)
+    return SONGS
+
+
+def get_song(conn: sqlite3.Connection, song_id: int) -> Optional[Dict[str, Any]]:
+    """Get one song by ID, or None if it is not in the catalog."""
+    if not SONGS:
+        load_catalog(conn)
+    return SONGS_BY_ID.get(song_id)
+
+
+def get_songs_by_subgenre(conn: sqlite3.Connection, subgenre: str) -> List[Dict[str, Any]]:
+    """Get the shared list of songs in a subgenre (empty if there are none)."""
+    if not SONGS:
+        load_catalog(conn)
+    return SONGS_BY_SUBGENRE.get(subgenre, [])
+
+
+def get_song_titles(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """Get (id, title, artist) rows ordered by title."""
+    if not SONGS:
+        load_catalog(conn)
+    return SONG_TITLES
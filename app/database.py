@@ -2,14 +2,78 @@
 
 import csv
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, List, Set
 
 from flask import g, current_app
 
+from .catalog import load_catalog
+from .pool import ConnectionPool
+
+
+# Connection pools keyed by database path
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+# Database files already switched to WAL (the journal mode persists in the file)
+_wal_paths: Set[str] = set()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a connection configured for reuse across requests."""
+    # Room for every distinct statement the app issues, so none are re-prepared
+    db = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+    db.row_factory = sqlite3.Row
+    if db_path not in _wal_paths:
+        db.execute("PRAGMA journal_mode=WAL")
+        _wal_paths.add(db_path)
+    # The remaining settings are per connection
+    db.execute("PRAGMA foreign_keys=ON")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA cache_size=-65536")
+    db.execute("PRAGMA mmap_size=268435456")
+    return db
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    """
+    Get the connection pool for a database file, creating it on first use.
+    
+    Args:
+        db_path: Path to the SQLite database file
+        
+    Returns:
+        Pool shared by every request in this process
+    """
+    pool = _pools.get(db_path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(db_path)
+            if pool is None:
+                pool = _pools[db_path] = ConnectionPool(lambda: _connect(db_path))
+    return pool
+
+
+def close_pool(db_path: str) -> None:
+    """Close the idle connections to a database file and forget its pool."""
+    with _pools_lock:
+        pool = _pools.pop(db_path, None)
+    if pool is not None:
+        pool.close()
+
 
 def get_db() -> sqlite3.Connection:
-    """Get database connection for current request context."""
+    """
+    Get database connection for current request context.
+    
+    The connection is taken from the pool on first use in the request and
+    handed back by close_db, so its caches stay warm between requests.
+    
+    Returns:
+        Connection owned by the current request
+    """
     db = getattr(g, '_database', None)
     if db is None:
         db_path = current_app.config.get("DATABASE_URL", "sqlite:///playlist.db")
@@ -17,21 +81,17 @@ def get_db() -> sqlite3.Connection:
         if db_path.startswith("sqlite:///"):
             db_path = db_path[10:]
         
-        db = g._database = sqlite3.connect(db_path)
-        db.row_factory = sqlite3.Row
+        pool = g._database_pool = get_pool(db_path)
+        db = g._database = pool.get()
     return db
 
 
 def close_db(exception: Optional[Exception] = None) -> None:
-    """Close database connection."""
-    db = getattr(g, '_database', None)
+    """Return the request's connection to its pool, discarding any uncommitted work."""
+    db = g.pop('_database', None)
+    pool = g.pop('_database_pool', None)
     if db is not None:
-        db.close()
-
-
-def dict_factory(cursor: sqlite3.Cursor, row: sqlite3.Row) -> Dict[str, Any]:
-    """Convert SQL row to dict."""
-    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+        pool.put(db)
 
 
 def health_check_db() -> tuple[bool, float]:
@@ -45,11 +105,9 @@ def health_check_db() -> tuple[bool, float]:
     
     try:
         db = get_db()
-        cursor = db.cursor()
         
         start = time.time()
-        cursor.execute("SELECT 1")
-        cursor.fetchone()
+        db.execute("SELECT 1").fetchone()
         latency_ms = (time.time() - start) * 1000
         
         return True, latency_ms
@@ -65,6 +123,9 @@ def init_db(db_path: Optional[str] = None) -> None:
         db_path = db_path[10:]
     
     conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     cursor = conn.cursor()
     
     # Create tables if they don't exist
@@ -121,27 +182,119 @@ def init_db(db_path: Optional[str] = None) -> None:
     )
     ''')
     
+    # Index the columns used for lookups and filtering
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_playlists_user ON playlists(user_id, created_at DESC)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ps_playlist_position ON playlist_songs(playlist_id, position)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_ps_song ON playlist_songs(song_id)")
+    
+    # Deleting a playlist removes its songs within the same statement
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS playlists_ad AFTER DELETE ON playlists BEGIN
+        DELETE FROM playlist_songs WHERE playlist_id = old.id;
+    END
+    ''')
+    
+    # One feedback row per user and song, so answers can be upserted; older
+    # databases may hold duplicates, of which the latest answer is kept
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_feedback_unique'"
+    )
+    if cursor.fetchone() is None:
+        cursor.execute(
+            """
+            DELETE FROM user_song_feedback WHERE id NOT IN (
+                SELECT MAX(id) FROM user_song_feedback GROUP BY user_id, song_id
+            )
+            """
+        )
+        cursor.execute(
+            "CREATE UNIQUE INDEX idx_feedback_unique ON user_song_feedback(user_id, song_id)"
+        )
+    
+    # Full-text index for song lookups by name
+    init_search_index(conn)
+    
     # Check if songs table is empty
     cursor.execute("SELECT COUNT(*) FROM songs")
     count = cursor.fetchone()[0]
     
     if count == 0:
         seed_songs(conn)
+        # Give the query planner statistics for the freshly seeded catalog
+        cursor.execute("ANALYZE")
     
     conn.commit()
+    
+    # Songs are read-only after seeding; serve them from memory
+    load_catalog(conn)
     conn.close()
 
 
+# Title/artist search index; diacritics are folded so "cafe" finds "Café"
+SONGS_FTS_SQL = (
+    "CREATE VIRTUAL TABLE songs_fts USING fts5("
+    "title, artist, content='songs', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')"
+)
+
+
+def init_search_index(conn: sqlite3.Connection) -> None:
+    """
+    Create the songs_fts full-text index and the triggers that keep it in sync.
+    
+    The index is rebuilt from the songs table whenever it is (re)created, so
+    existing databases are backfilled and pick up tokenizer changes. Does
+    nothing if SQLite was built without FTS5; lookups then fall back to LIKE.
+    
+    Args:
+        conn: Database connection
+    """
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'songs_fts'"
+    ).fetchone()
+    created = row is None or row[0] != SONGS_FTS_SQL
+    
+    try:
+        if created:
+            conn.execute("DROP TABLE IF EXISTS songs_fts")
+            conn.execute(SONGS_FTS_SQL)
+    except sqlite3.OperationalError:
+        return
+    
+    conn.executescript('''
+    CREATE TRIGGER IF NOT EXISTS songs_fts_ai AFTER INSERT ON songs BEGIN
+        INSERT INTO songs_fts(rowid, title, artist) VALUES (new.id, new.title, new.artist);
+    END;
+    CREATE TRIGGER IF NOT EXISTS songs_fts_ad AFTER DELETE ON songs BEGIN
+        INSERT INTO songs_fts(songs_fts, rowid, title, artist)
+        VALUES ('delete', old.id, old.title, old.artist);
+    END;
+    CREATE TRIGGER IF NOT EXISTS songs_fts_au AFTER UPDATE ON songs BEGIN
+        INSERT INTO songs_fts(songs_fts, rowid, title, artist)
+        VALUES ('delete', old.id, old.title, old.artist);
+        INSERT INTO songs_fts(rowid, title, artist) VALUES (new.id, new.title, new.artist);
+    END;
+    ''')
+    
+    if created:
+        conn.execute("INSERT INTO songs_fts(songs_fts) VALUES ('rebuild')")
+
+
 def seed_songs(conn: sqlite3.Connection) -> None:
     """Seed songs from CSV file."""
     seed_file = Path("seed/house_tracks.csv")
-    cursor = conn.cursor()
     
-    with open(seed_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cursor.execute(
-                "INSERT INTO songs (title, artist, subgenre, year, tags, bpm) VALUES (?, ?, ?, ?, ?, ?)",
+    # The songs table is empty, so skip fsyncs for the bulk load (the
+    # setting cannot change inside a transaction, so settle pending work)
+    conn.commit()
+    conn.execute("PRAGMA synchronous=OFF")
+    try:
+        with open(seed_file, 'r', encoding='utf-8') as f:
+            rows = (
                 (
                     row["title"],
                     row["artist"],
@@ -150,6 +303,14 @@ def seed_songs(conn: sqlite3.Connection) -> None:
                     row["tags"],
                     int(row["bpm"]) if row["bpm"] else None
                 )
+                for row in csv.DictReader(f)
             )
-    
-    conn.commit()
+            
+            # One prepared statement and one transaction, streaming the CSV
+            with conn:
+                conn.executemany(
+                    "INSERT INTO songs (title, artist, subgenre, year, tags, bpm) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+    finally:
+        conn.execute("PRAGMA synchronous=NORMAL")
@@ -0,0 +1,60 @@
+"""Pool of reusable SQLite connections."""
+
+import os
+import queue
+import sqlite3
+from typing import Callable
+
+# SQLite serializes writers, so a small pool per process is enough
+POOL_SIZE = min((os.cpu_count() or 1) * 2, 16)
+
+
+class ConnectionPool:
+    """
+    LIFO pool of connections to a single database file.
+    
+    The most recently returned connection is handed out first, so its page
+    cache and prepared statements are the warmest. ``get`` never blocks: an
+    empty pool opens a new connection, and connections returned to a full
+    pool are closed.
+    """
+    
+    def __init__(self, connect: Callable[[], sqlite3.Connection], maxsize: int = POOL_SIZE):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            connect: Factory that opens a configured connection
+            maxsize: Maximum number of idle connections kept open
+        """
+        self._connect = connect
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=maxsize)
+    
+    def get(self) -> sqlite3.Connection:
+        """Take an idle connection, or open a new one if none is available."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+    
+    def put(self, conn: sqlite3.Connection) -> None:
+        """
+        Return a connection to the pool, discarding any uncommitted work.
+        
+        Args:
+            conn: Connection previously obtained from get
+        """
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
@@ -0,0 +1,20 @@
+"""Shared decorators for route handlers."""
+
+from functools import wraps
+
+from flask import request
+
+
+def require_json(f):
+    """
+    Parse the request body as a JSON object and pass it to the view as ``data``.
+    
+    Responds with 400 when the body is missing, malformed, or not an object.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        data = request.get_json(silent=True, cache=False)
+        if not isinstance(data, dict):
+            return {"error": "Invalid JSON"}, 400
+        return f(*args, data=data, **kwargs)
+    return decorated_function
@@ -1,29 +1,63 @@
 """Frontend routes for HTML templates."""
 
-from flask import Blueprint, render_template
+from functools import lru_cache
+
+from flask import Blueprint, make_response, render_template, request
+from werkzeug.http import generate_etag
 
 bp = Blueprint("frontend", __name__)
 
+# Templates served by this blueprint; none of them take any context
+PAGES = ("home.html", "quiz.html", "generate.html", "profile.html")
+
+
+@lru_cache(maxsize=None)
+def _render_page(template_name):
+    """Render a template that takes no context once and reuse the HTML and its ETag."""
+    html = render_template(template_name)
+    return html, generate_etag(html.encode())
+
+
+def warm_pages(app):
+    """
+    Render every page up front so workers forked from a preloaded app share it.
+    
+    Args:
+        app: Flask application with the frontend blueprint and static URL hooks registered
+    """
+    # url_for needs a request context to build the static asset URLs
+    with app.test_request_context():
+        for template_name in PAGES:
+            _render_page(template_name)
+
+
+def _page_response(template_name):
+    """Serve a cached page, answering 304 when the client already has it."""
+    html, etag = _render_page(template_name)
+    response = make_response(html)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
 
 @bp.route("/")
 def home():
     """Home page - user login."""
-    return render_template("home.html")
+    return _page_response("home.html")
 
 
 @bp.route("/quiz")
 def quiz_page():
     """Quiz page."""
-    return render_template("quiz.html")
+    return _page_response("quiz.html")
 
 
 @bp.route("/generate")
 def generate_page():
     """Playlist generation page."""
-    return render_template("generate.html")
+    return _page_response("generate.html")
 
 
 @bp.route("/profile")
 def profile_page():
     """User profile with saved playlists."""
-    return render_template("profile.html")
+    return _page_response("profile.html")
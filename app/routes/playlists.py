@@ -3,6 +3,7 @@
 from flask import Blueprint, request, jsonify, current_app
 
 from ..database import get_db
+from .decorators import require_json
 from ..config import get_config
 from ..services.user_service import UserService
 from ..services.song_service import SongService
@@ -15,15 +16,9 @@ bp = Blueprint("playlists", __name__)
 
 
 @bp.route("/generate", methods=["POST"])
-def generate_playlist():
+@require_json
+def generate_playlist(data):
     """Generate a playlist based on user taste."""
-    if not request.is_json:
-        return jsonify({"error": "Request must be JSON"}), 400
-        
-    data = request.get_json()
-    if data is None:
-        return jsonify({"error": "Invalid JSON"}), 400
-        
     user_id = data.get("user_id")
     count = data.get("count", 20)
     genre = data.get("genre")
@@ -36,11 +31,9 @@ def generate_playlist():
         db = get_db()
         
         # Verify user exists
-        user = UserService.get_user_by_id(db, user_id)
-        if not user:
+        if not UserService.user_exists(db, user_id):
             # Track failure
-            if playlist_generate_total:
-                playlist_generate_total.labels(success='false', genre=genre or 'none').inc()
+            playlist_generate_total.labels(success='false', genre=genre or 'none').inc()
             return jsonify({"error": "User not found"}), 404
         
         # Get all songs
@@ -55,8 +48,7 @@ def generate_playlist():
             seed_song = SongService.search_song_by_name(db, seed_song_name)
             if not seed_song:
                 # Track failure
-                if playlist_generate_total:
-                    playlist_generate_total.labels(success='false', genre=genre or 'none').inc()
+                playlist_generate_total.labels(success='false', genre=genre or 'none').inc()
                 return jsonify({"error": f"No song found matching '{seed_song_name}'"}), 404
         
         # Initialize recommender
@@ -74,27 +66,19 @@ def generate_playlist():
             )
         
         # Track success
-        if playlist_generate_total:
-            playlist_generate_total.labels(success='true', genre=genre or 'none').inc()
+        playlist_generate_total.labels(success='true', genre=genre or 'none').inc()
         
         return jsonify(result), 200
     except Exception as e:
         # Track failure
-        if playlist_generate_total:
-            playlist_generate_total.labels(success='false', genre=genre or 'none').inc()
+        playlist_generate_total.labels(success='false', genre=genre or 'none').inc()
         return jsonify({"error": str(e)}), 500
 
 
 @bp.route("", methods=["POST"])
-def create_playlist():
+@require_json
+def create_playlist(data):
     """Save a playlist to user's profile."""
-    if not request.is_json:
-        return jsonify({"error": "Request must be JSON"}), 400
-        
-    data = request.get_json()
-    if data is None:
-        return jsonify({"error": "Invalid JSON"}), 400
-        
     user_id = data.get("user_id")
     name = data.get("name")
     song_ids = data.get("song_ids", [])
@@ -102,18 +86,24 @@ def create_playlist():
     if not all([user_id, name, song_ids]):
         return jsonify({"error": "user_id, name, and song_ids are required"}), 400
     
+    # Song IDs must be JSON integers, as the quiz's n must be; bool is an
+    # int subclass, so reject it explicitly
+    if not isinstance(song_ids, list) or any(
+        isinstance(song_id, bool) or not isinstance(song_id, int) for song_id in song_ids
+    ):
+        return jsonify({"error": "song_ids must be a list of integers"}), 400
+    
     try:
         db = get_db()
         
         # Verify user exists
-        user = UserService.get_user_by_id(db, user_id)
-        if not user:
+        if not UserService.user_exists(db, user_id):
             return jsonify({"error": "User not found"}), 404
         
         # Verify all songs exist
+        found_ids = SongService.get_existing_song_ids(db, song_ids)
         for song_id in song_ids:
-            song = SongService.get_song_by_id(db, song_id)
-            if not song:
+            if song_id not in found_ids:
                 return jsonify({"error": f"Song {song_id} not found"}), 404
         
         # Create playlist
@@ -136,8 +126,7 @@ def get_user_playlists():
         db = get_db()
         
         # Verify user exists
-        user = UserService.get_user_by_id(db, int(user_id))
-        if not user:
+        if not UserService.user_exists(db, int(user_id)):
             return jsonify({"error": "User not found"}), 404
         
         # Get playlists
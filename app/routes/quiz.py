@@ -1,25 +1,21 @@
 """Quiz routes."""
 
-from flask import Blueprint, request, jsonify
+import sqlite3
+
+from flask import Blueprint, jsonify
 
 from ..database import get_db
+from .decorators import require_json
 from ..services.user_service import UserService
-from ..services.song_service import SongService
 from ..services.quiz_service import QuizService
 
 bp = Blueprint("quiz", __name__)
 
 
 @bp.route("/start", methods=["POST"])
-def start_quiz():
+@require_json
+def start_quiz(data):
     """Start a quiz by getting N random songs."""
-    if not request.is_json:
-        return jsonify({"error": "Request must be JSON"}), 400
-        
-    data = request.get_json()
-    if data is None:
-        return jsonify({"error": "Invalid JSON"}), 400
-        
     user_id = data.get("user_id")
     n = data.get("n", 10)
     
@@ -30,8 +26,7 @@ def start_quiz():
         db = get_db()
         
         # Verify user exists
-        user = UserService.get_user_by_id(db, user_id)
-        if not user:
+        if not UserService.user_exists(db, user_id):
             return jsonify({"error": "User not found"}), 404
         
         # Get quiz songs
@@ -44,15 +39,9 @@ def start_quiz():
 
 
 @bp.route("/answer", methods=["POST"])
-def answer_quiz():
+@require_json
+def answer_quiz(data):
     """Record user's like/dislike for a song."""
-    if not request.is_json:
-        return jsonify({"error": "Request must be JSON"}), 400
-        
-    data = request.get_json()
-    if data is None:
-        return jsonify({"error": "Invalid JSON"}), 400
-        
     user_id = data.get("user_id")
     song_id = data.get("song_id")
     liked = data.get("liked")
@@ -63,18 +52,15 @@ def answer_quiz():
     try:
         db = get_db()
         
-        # Verify user exists
-        user = UserService.get_user_by_id(db, user_id)
-        if not user:
-            return jsonify({"error": "User not found"}), 404
-        
-        # Verify song exists
-        song = SongService.get_song_by_id(db, song_id)
-        if not song:
+        # Save feedback; foreign keys reject unknown users and songs
+        try:
+            QuizService.save_feedback(db, user_id, song_id, liked)
+        except sqlite3.IntegrityError:
+            db.rollback()
+            if not UserService.user_exists(db, user_id):
+                return jsonify({"error": "User not found"}), 404
             return jsonify({"error": "Song not found"}), 404
         
-        # Save feedback
-        QuizService.save_feedback(db, user_id, song_id, liked)
         return jsonify({"status": "success"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
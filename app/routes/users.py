@@ -1,23 +1,18 @@
 """User routes."""
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, jsonify
 
 from ..database import get_db
+from .decorators import require_json
 from ..services.user_service import UserService
 
 bp = Blueprint("users", __name__)
 
 
 @bp.route("", methods=["POST"])
-def create_user():
+@require_json
+def create_user(data):
     """Create a new user or get existing user by name."""
-    if not request.is_json:
-        return jsonify({"error": "Request must be JSON"}), 400
-        
-    data = request.get_json()
-    if data is None:
-        return jsonify({"error": "Invalid JSON"}), 400
-        
     name = data.get("name")
     if not name:
         return jsonify({"error": "Name is required"}), 400
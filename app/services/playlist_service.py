@@ -3,7 +3,7 @@
 import sqlite3
 from typing import List, Dict, Any, Optional
 
-from ..database import dict_factory
+from .. import catalog
 
 
 class PlaylistService:
@@ -28,21 +28,17 @@ class PlaylistService:
         Returns:
             New playlist ID
         """
-        cursor = db.cursor()
-        
         # Create playlist
-        cursor.execute(
+        playlist_id = db.execute(
             "INSERT INTO playlists (user_id, name) VALUES (?, ?)",
             (user_id, name)
-        )
-        playlist_id = cursor.lastrowid
+        ).lastrowid
         
         # Add songs to playlist
-        for position, song_id in enumerate(song_ids, start=1):
-            cursor.execute(
-                "INSERT INTO playlist_songs (playlist_id, song_id, position) VALUES (?, ?, ?)",
-                (playlist_id, song_id, position)
-            )
+        db.executemany(
+            "INSERT INTO playlist_songs (playlist_id, song_id, position) VALUES (?, ?, ?)",
+            [(playlist_id, song_id, position) for position, song_id in enumerate(song_ids, start=1)]
+        )
         
         db.commit()
         
@@ -63,26 +59,18 @@ class PlaylistService:
         Returns:
             List of playlist dicts with song counts
         """
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        
-        # Get playlists
-        cursor.execute(
-            "SELECT * FROM playlists WHERE user_id = ? ORDER BY created_at DESC",
+        # Get playlists together with their song counts
+        return db.execute(
+            """
+            SELECT p.*, COUNT(ps.id) AS song_count
+            FROM playlists p
+            LEFT JOIN playlist_songs ps ON ps.playlist_id = p.id
+            WHERE p.user_id = ?
+            GROUP BY p.id
+            ORDER BY p.created_at DESC
+            """,
             (user_id,)
-        )
-        playlists = cursor.fetchall()
-        
-        # Add song count to each playlist
-        for playlist in playlists:
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM playlist_songs WHERE playlist_id = ?",
-                (playlist["id"],)
-            )
-            song_count = cursor.fetchone()["count"]
-            playlist["song_count"] = song_count
-        
-        return playlists
+        ).fetchall()
     
     @staticmethod
     def get_playlist_by_id(
@@ -99,38 +87,39 @@ class PlaylistService:
         Returns:
             Playlist dict with songs or None if not found
         """
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        
-        # Get playlist
-        cursor.execute("SELECT * FROM playlists WHERE id = ?", (playlist_id,))
-        playlist = cursor.fetchone()
-        if not playlist:
-            return None
-        
-        # Get playlist songs
-        cursor.execute(
+        # Get the playlist and its song IDs in one query; the songs themselves
+        # are resolved against the in-memory catalog instead of joining songs
+        rows = db.execute(
             """
-            SELECT s.*, ps.position 
-            FROM songs s 
-            JOIN playlist_songs ps ON s.id = ps.song_id 
-            WHERE ps.playlist_id = ? 
+            SELECT p.id, p.user_id, p.name, p.created_at, ps.song_id, ps.position
+            FROM playlists p
+            LEFT JOIN playlist_songs ps ON ps.playlist_id = p.id
+            WHERE p.id = ?
             ORDER BY ps.position
             """,
             (playlist_id,)
-        )
-        songs_data = cursor.fetchall()
+        ).fetchall()
+        if not rows:
+            return None
         
         # Format response - structure songs as the frontend expects
         formatted_songs = []
-        for song_data in songs_data:
-            position = song_data.pop('position')
-            formatted_songs.append({
-                'position': position,
-                'song': song_data
-            })
-        
-        playlist["songs"] = formatted_songs
+        for row in rows:
+            song = catalog.get_song(db, row["song_id"])
+            if song is not None:
+                formatted_songs.append({
+                    'position': row["position"],
+                    'song': song
+                })
+        
+        first = rows[0]
+        playlist = {
+            "id": first["id"],
+            "user_id": first["user_id"],
+            "name": first["name"],
+            "created_at": first["created_at"],
+            "songs": formatted_songs,
+        }
         
         return playlist
     
@@ -146,19 +135,9 @@ class PlaylistService:
         Returns:
             True if deleted, False if not found
         """
-        cursor = db.cursor()
-        
-        # Verify playlist exists
-        cursor.execute("SELECT * FROM playlists WHERE id = ?", (playlist_id,))
-        playlist = cursor.fetchone()
-        if not playlist:
-            return False
-        
-        # Delete playlist songs first
-        cursor.execute("DELETE FROM playlist_songs WHERE playlist_id = ?", (playlist_id,))
-        
-        # Delete playlist
-        cursor.execute("DELETE FROM playlists WHERE id = ?", (playlist_id,))
+        # The playlists_ad trigger deletes the playlist's songs; the row count
+        # tells us whether it existed, so no separate lookup is needed
+        deleted = db.execute("DELETE FROM playlists WHERE id = ?", (playlist_id,)).rowcount
         
         db.commit()
-        return True
+        return deleted > 0
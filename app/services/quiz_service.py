@@ -1,10 +1,9 @@
 """Quiz service for managing user feedback."""
 
-import random
 import sqlite3
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any
 
-from ..database import dict_factory
+from .. import catalog
 
 
 class QuizService:
@@ -27,32 +26,38 @@ class QuizService:
         Returns:
             List of song dicts
         """
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
+        # SQLite treats a negative LIMIT as no limit, so check n up front
+        if isinstance(n, bool) or not isinstance(n, int) or n < 0:
+            raise ValueError("n must be a non-negative integer")
         
-        # Get all songs
-        cursor.execute("SELECT * FROM songs")
-        all_songs = cursor.fetchall()
-        
-        if len(all_songs) < n:
+        if len(catalog.get_all_songs(db)) < n:
             raise ValueError("Not enough songs in database")
         
-        # Get already rated songs
-        cursor.execute("SELECT song_id FROM user_song_feedback WHERE user_id = ?", (user_id,))
-        rated_song_ids: Set[int] = {row["song_id"] for row in cursor.fetchall()}
-        
-        # Filter out already rated songs
-        unrated_songs = [s for s in all_songs if s["id"] not in rated_song_ids]
+        # Sample unrated song IDs in SQL and resolve them from the catalog,
+        # so no song rows are materialized
+        song_ids = db.execute(
+            """
+            SELECT id FROM songs
+            WHERE id NOT IN (SELECT song_id FROM user_song_feedback WHERE user_id = ?)
+            ORDER BY RANDOM()
+            LIMIT ?
+            """,
+            (user_id, n)
+        ).fetchall()
         
         # If not enough unrated songs, include some rated ones
-        if len(unrated_songs) < n:
-            rated_songs = [s for s in all_songs if s["id"] in rated_song_ids]
-            songs_to_return = unrated_songs + random.sample(
-                rated_songs,
-                min(n - len(unrated_songs), len(rated_songs))
-            )
-        else:
-            songs_to_return = random.sample(unrated_songs, n)
+        if len(song_ids) < n:
+            song_ids += db.execute(
+                """
+                SELECT id FROM songs
+                WHERE id IN (SELECT song_id FROM user_song_feedback WHERE user_id = ?)
+                ORDER BY RANDOM()
+                LIMIT ?
+                """,
+                (user_id, n - len(song_ids))
+            ).fetchall()
+        
+        songs_to_return = [catalog.get_song(db, song_id) for song_id, in song_ids]
         
         return songs_to_return
     
@@ -66,34 +71,22 @@ class QuizService:
         """
         Save or update user feedback for a song.
         
+        Unknown users or songs fail the foreign key checks and raise
+        sqlite3.IntegrityError.
+        
         Args:
             db: Database connection
             user_id: User ID
             song_id: Song ID
             liked: Whether user liked the song
         """
-        cursor = db.cursor()
-        
-        # Check if feedback already exists
-        cursor.execute(
-            "SELECT * FROM user_song_feedback WHERE user_id = ? AND song_id = ?",
-            (user_id, song_id)
+        db.execute(
+            """
+            INSERT INTO user_song_feedback (user_id, song_id, liked) VALUES (?, ?, ?)
+            ON CONFLICT (user_id, song_id) DO UPDATE SET liked = excluded.liked
+            """,
+            (user_id, song_id, liked)
         )
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing feedback
-            cursor.execute(
-                "UPDATE user_song_feedback SET liked = ? WHERE id = ?",
-                (liked, existing["id"])
-            )
-        else:
-            # Create new feedback
-            cursor.execute(
-                "INSERT INTO user_song_feedback (user_id, song_id, liked) VALUES (?, ?, ?)",
-                (user_id, song_id, liked)
-            )
-        
         db.commit()
     
     @staticmethod
@@ -111,21 +104,20 @@ class QuizService:
         Returns:
             Tuple of (liked_songs, disliked_songs)
         """
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        
-        # Get user's feedback
-        cursor.execute("SELECT * FROM user_song_feedback WHERE user_id = ?", (user_id,))
-        feedbacks = cursor.fetchall()
+        # Get the user's feedback; the rated songs come from the catalog
+        rows = db.execute(
+            "SELECT song_id, liked FROM user_song_feedback WHERE user_id = ? ORDER BY id",
+            (user_id,)
+        )
         
         liked_songs = []
         disliked_songs = []
         
-        for feedback in feedbacks:
-            cursor.execute("SELECT * FROM songs WHERE id = ?", (feedback["song_id"],))
-            song = cursor.fetchone()
-            
-            if feedback["liked"]:
+        for song_id, liked in rows:
+            song = catalog.get_song(db, song_id)
+            if song is None:
+                continue
+            if liked:
                 liked_songs.append(song)
             else:
                 disliked_songs.append(song)
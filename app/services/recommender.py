@@ -1,10 +1,36 @@
 """Recommendation service for playlist generation."""
 
+import heapq
+import os
 import random
-from typing import List, Dict, Any, Optional, Set
+import sys
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from statistics import median
+from typing import List, Dict, Any, FrozenSet, Optional, Set
 
 from ..config import Config
 
+# Module-level generator for score jitter and cold-start sampling
+_rng = random.Random()
+
+# Forked workers (gunicorn --preload) would otherwise inherit the same state
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_rng.seed)
+
+
+@lru_cache(maxsize=4096)
+def _parse_tags(tags: str) -> FrozenSet[str]:
+    """Split a semicolon-separated tag string, memoized per distinct string."""
+    # Interned tags compare by identity when sets from different songs meet
+    return frozenset(map(sys.intern, tags.split(';')))
+
+
+def _tag_set(song: Dict[str, Any]) -> FrozenSet[str]:
+    """Get a song's tags as a set."""
+    return _parse_tags(song["tags"]) if song["tags"] else frozenset()
+
 
 class RecommenderService:
     """Service for generating song recommendations based on user taste."""
@@ -13,6 +39,155 @@ class RecommenderService:
         """Initialize recommender with configuration."""
         self.config = config
     
+    def build_profile(
+        self,
+        liked_songs: List[Dict[str, Any]],
+        disliked_songs: List[Dict[str, Any]],
+        seed_song: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Precompute the taste aggregates shared by every candidate song.
+        
+        Args:
+            liked_songs: List of songs the user liked
+            disliked_songs: List of songs the user disliked
+            seed_song: Optional seed song for similarity bonus
+            
+        Returns:
+            Profile dict consumed by score_batch
+        """
+        # Net like/dislike counts per artist and subgenre
+        artist_affinity = Counter(s["artist"] for s in liked_songs)
+        artist_affinity.subtract(s["artist"] for s in disliked_songs)
+        subgenre_affinity = Counter(s["subgenre"] for s in liked_songs)
+        subgenre_affinity.subtract(s["subgenre"] for s in disliked_songs)
+        
+        liked_bpms = [s["bpm"] for s in liked_songs if s["bpm"]]
+        liked_years = [s["year"] for s in liked_songs]
+        
+        return {
+            "artist_affinity": artist_affinity,
+            "subgenre_affinity": subgenre_affinity,
+            # How many liked songs carry each tag
+            "liked_tag_counts": Counter(tag for s in liked_songs for tag in _tag_set(s)),
+            "median_bpm": median(liked_bpms) if liked_bpms else None,
+            "median_year": median(liked_years) if liked_years else None,
+            "seed_song": seed_song,
+            "seed_tags": _tag_set(seed_song) if seed_song else frozenset(),
+        }
+    
+    def score_batch(
+        self,
+        songs: List[Dict[str, Any]],
+        profile: Dict[str, Any]
+    ) -> List[float]:
+        """
+        Score songs against a prebuilt profile in a single pass.
+        
+        Weights and profile aggregates are bound to locals once per batch,
+        so the per-song work is only lookups and arithmetic.
+        
+        Args:
+            songs: Songs to score
+            profile: Profile returned by build_profile
+            
+        Returns:
+            Scores in the same order as songs
+        """
+        config = self.config
+        artist_weight = config.ARTIST_WEIGHT
+        subgenre_weight = config.SUBGENRE_WEIGHT
+        tag_weight = config.TAG_WEIGHT
+        bpm_weight = config.BPM_WEIGHT
+        era_weight = config.ERA_WEIGHT
+        bpm_tolerance = config.BPM_TOLERANCE
+        year_tolerance = config.YEAR_TOLERANCE
+        
+        artist_affinity = profile["artist_affinity"].get
+        subgenre_affinity = profile["subgenre_affinity"].get
+        liked_tag_counts = profile["liked_tag_counts"]
+        liked_tags = liked_tag_counts.keys()
+        median_bpm = profile["median_bpm"]
+        median_year = profile["median_year"]
+        
+        seed_song = profile["seed_song"]
+        seed_tags = profile["seed_tags"]
+        if seed_song:
+            seed_artist = seed_song["artist"]
+            seed_subgenre = seed_song["subgenre"]
+            seed_bpm = seed_song["bpm"]
+            seed_artist_weight = config.SEED_ARTIST_WEIGHT
+            seed_subgenre_weight = config.SEED_SUBGENRE_WEIGHT
+            seed_tag_weight = config.SEED_TAG_WEIGHT
+            seed_bpm_weight = config.SEED_BPM_WEIGHT
+        
+        jitter = _rng.random
+        parse_tags = _parse_tags
+        no_tags = frozenset()
+        scores = []
+        
+        for song in songs:
+            bpm = song["bpm"]
+            
+            # Artist and subgenre affinity
+            score = (
+                artist_affinity(song["artist"], 0) * artist_weight
+                + subgenre_affinity(song["subgenre"], 0) * subgenre_weight
+            )
+            
+            # Tag overlap with liked songs (parsed tag sets are memoized per
+            # tag string, looked up inline rather than through _tag_set)
+            tags = song["tags"]
+            song_tags = parse_tags(tags) if tags else no_tags
+            score += sum(map(liked_tag_counts.__getitem__, liked_tags & song_tags)) * tag_weight
+            
+            # BPM proximity
+            if bpm and median_bpm is not None and abs(bpm - median_bpm) <= bpm_tolerance:
+                score += bpm_weight
+            
+            # Era proximity
+            if median_year is not None and abs(song["year"] - median_year) <= year_tolerance:
+                score += era_weight
+            
+            # Seed song similarity
+            if seed_song:
+                if song["artist"] == seed_artist:
+                    score += seed_artist_weight
+                if song["subgenre"] == seed_subgenre:
+                    score += seed_subgenre_weight
+                
+                score += len(song_tags & seed_tags) * seed_tag_weight
+                
+                if bpm and seed_bpm and abs(bpm - seed_bpm) <= bpm_tolerance:
+                    score += seed_bpm_weight
+            
+            # Add small random jitter to avoid ties
+            scores.append(score + jitter() * 0.1)
+        
+        return scores
+    
+    def score_songs(
+        self,
+        songs: List[Dict[str, Any]],
+        liked_songs: List[Dict[str, Any]],
+        disliked_songs: List[Dict[str, Any]],
+        seed_song: Optional[Dict[str, Any]] = None
+    ) -> List[float]:
+        """
+        Score a batch of songs against the same taste profile.
+        
+        Args:
+            songs: Songs to score
+            liked_songs: List of songs the user liked
+            disliked_songs: List of songs the user disliked
+            seed_song: Optional seed song for similarity bonus
+            
+        Returns:
+            Scores in the same order as songs
+        """
+        profile = self.build_profile(liked_songs, disliked_songs, seed_song)
+        return self.score_batch(songs, profile)
+    
     def score_song(
         self,
         song: Dict[str, Any],
@@ -32,66 +207,7 @@ class RecommenderService:
         Returns:
             Score value (higher is better)
         """
-        score = 0.0
-        
-        # Artist affinity
-        for liked in liked_songs:
-            if song["artist"] == liked["artist"]:
-                score += self.config.ARTIST_WEIGHT
-        
-        for disliked in disliked_songs:
-            if song["artist"] == disliked["artist"]:
-                score -= self.config.ARTIST_WEIGHT
-        
-        # Subgenre affinity
-        for liked in liked_songs:
-            if song["subgenre"] == liked["subgenre"]:
-                score += self.config.SUBGENRE_WEIGHT
-        
-        for disliked in disliked_songs:
-            if song["subgenre"] == disliked["subgenre"]:
-                score -= self.config.SUBGENRE_WEIGHT
-        
-        # Tag overlap with liked songs
-        song_tags = set(song["tags"].split(';')) if song["tags"] else set()
-        for liked in liked_songs:
-            liked_tags = set(liked["tags"].split(';')) if liked["tags"] else set()
-            overlap = song_tags & liked_tags
-            score += len(overlap) * self.config.TAG_WEIGHT
-        
-        # BPM proximity
-        if song["bpm"] and liked_songs:
-            liked_bpms = [s["bpm"] for s in liked_songs if s["bpm"]]
-            if liked_bpms:
-                median_bpm = sum(liked_bpms) / len(liked_bpms)
-                if abs(song["bpm"] - median_bpm) <= self.config.BPM_TOLERANCE:
-                    score += self.config.BPM_WEIGHT
-        
-        # Era proximity
-        if liked_songs:
-            liked_years = [s["year"] for s in liked_songs]
-            median_year = sum(liked_years) / len(liked_years)
-            if abs(song["year"] - median_year) <= self.config.YEAR_TOLERANCE:
-                score += self.config.ERA_WEIGHT
-        
-        # Seed song similarity
-        if seed_song:
-            if song["artist"] == seed_song["artist"]:
-                score += self.config.SEED_ARTIST_WEIGHT
-            if song["subgenre"] == seed_song["subgenre"]:
-                score += self.config.SEED_SUBGENRE_WEIGHT
-            
-            seed_tags = set(seed_song["tags"].split(';')) if seed_song["tags"] else set()
-            tag_overlap = song_tags & seed_tags
-            score += len(tag_overlap) * self.config.SEED_TAG_WEIGHT
-            
-            if song["bpm"] and seed_song["bpm"] and abs(song["bpm"] - seed_song["bpm"]) <= self.config.BPM_TOLERANCE:
-                score += self.config.SEED_BPM_WEIGHT
-        
-        # Add small random jitter to avoid ties
-        score += random.uniform(0, 0.1)
-        
-        return score
+        return self.score_songs([song], liked_songs, disliked_songs, seed_song)[0]
     
     def generate_recommendations(
         self,
@@ -118,38 +234,24 @@ class RecommenderService:
         """
         disliked_song_ids: Set[int] = {song["id"] for song in disliked_songs}
         
-        # Filter songs by genre if specified
-        if preferred_genre:
-            genre_songs = [s for s in all_songs if s["subgenre"] == preferred_genre]
-        else:
-            genre_songs = []
-        
-        # Score each song
-        scored_songs = []
+        # Taste aggregates are computed once and shared by every candidate
+        profile = self.build_profile(liked_songs, disliked_songs, seed_song)
         
-        # First, process songs from the preferred genre if specified
-        if preferred_genre and genre_songs:
-            for song in genre_songs:
-                if song["id"] in disliked_song_ids:
-                    continue
-                
-                # Give a genre bonus to preferred genre songs
-                score = self.score_song(song, liked_songs, disliked_songs, seed_song)
-                score += self.config.GENRE_BONUS
-                scored_songs.append((song, score))
+        # Score every song the user has not disliked exactly once
+        candidates = [s for s in all_songs if s["id"] not in disliked_song_ids]
+        scores = self.score_batch(candidates, profile)
         
-        # Then process all songs to fill the playlist if needed
-        for song in all_songs:
-            # Skip songs that are already scored or disliked
-            if song["id"] in disliked_song_ids or any(s["id"] == song["id"] for s, _ in scored_songs):
-                continue
-            
-            score = self.score_song(song, liked_songs, disliked_songs, seed_song)
-            scored_songs.append((song, score))
+        # Songs from the preferred genre get a bonus
+        if preferred_genre:
+            genre_bonus = self.config.GENRE_BONUS
+            scores = [
+                score + genre_bonus if song["subgenre"] == preferred_genre else score
+                for song, score in zip(candidates, scores, strict=True)
+            ]
         
-        # Sort by score and return top N
-        scored_songs.sort(key=lambda x: x[1], reverse=True)
-        result = [song for song, _ in scored_songs[:count]]
+        # Select the top N by score without sorting every candidate
+        top_songs = heapq.nlargest(count, zip(candidates, scores, strict=True), key=itemgetter(1))
+        result = [song for song, _ in top_songs]
         
         return result
     
@@ -175,17 +277,18 @@ class RecommenderService:
             
             # If we have enough songs in the preferred genre
             if len(genre_songs) >= count:
-                return random.sample(genre_songs, count)
+                return _rng.sample(genre_songs, count)
             
             # Otherwise create a mixed playlist
             result = genre_songs.copy()
-            remaining_songs = [song for song in all_songs if song not in result]
+            result_ids = {song["id"] for song in result}
+            remaining_songs = [song for song in all_songs if song["id"] not in result_ids]
             needed = count - len(result)
             
             if needed > 0 and remaining_songs:
-                result.extend(random.sample(remaining_songs, min(needed, len(remaining_songs))))
+                result.extend(_rng.sample(remaining_songs, min(needed, len(remaining_songs))))
             
             return result
         
         # No genre preference - return random songs
-        return random.sample(all_songs, min(count, len(all_songs)))
+        return _rng.sample(all_songs, min(count, len(all_songs)))
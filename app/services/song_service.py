@@ -1,9 +1,12 @@
 """Song service for song operations."""
 
+import re
 import sqlite3
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
-from ..database import dict_factory
+import orjson
+
+from .. import catalog
 
 
 class SongService:
@@ -11,11 +14,8 @@ class SongService:
     
     @staticmethod
     def get_all_songs(db: sqlite3.Connection) -> List[Dict[str, Any]]:
-        """Get all songs."""
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        cursor.execute("SELECT * FROM songs")
-        return cursor.fetchall()
+        """Get all songs from the in-memory catalog."""
+        return catalog.get_all_songs(db)
     
     @staticmethod
     def search_songs(
@@ -37,46 +37,79 @@ class SongService:
             List of song dicts
         """
         if titles_only:
-            query = "SELECT id, title, artist FROM songs ORDER BY title"
-            cursor = db.cursor()
-            cursor.row_factory = dict_factory
-            cursor.execute(query)
-            return cursor.fetchall()
-        
-        query = "SELECT * FROM songs"
-        params = []
-        
-        # Build where clause
-        where_clauses = []
-        
-        if search:
-            where_clauses.append("(title LIKE ? OR artist LIKE ?)")
-            params.extend([f'%{search}%', f'%{search}%'])
+            return catalog.get_song_titles(db)
         
         if genre:
-            where_clauses.append("subgenre = ?")
-            params.append(genre)
+            songs = catalog.get_songs_by_subgenre(db, genre)
+        else:
+            songs = catalog.get_all_songs(db)
         
-        if where_clauses:
-            query += " WHERE " + " AND ".join(where_clauses)
+        if search:
+            # Case-insensitive substring match on title or artist, against
+            # text casefolded once when the catalog was loaded
+            needle = search.casefold()
+            search_text = catalog.SEARCH_TEXT
+            songs = [s for s in songs if needle in search_text[s["id"]]]
         
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        cursor.execute(query, params)
-        return cursor.fetchall()
+        return songs
     
     @staticmethod
     def get_song_by_id(db: sqlite3.Connection, song_id: int) -> Optional[Dict[str, Any]]:
-        """Get song by ID."""
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        cursor.execute("SELECT * FROM songs WHERE id = ?", (song_id,))
-        return cursor.fetchone()
+        """Get song by ID from the in-memory catalog."""
+        return catalog.get_song(db, song_id)
+    
+    @staticmethod
+    def get_existing_song_ids(db: sqlite3.Connection, song_ids: List[int]) -> Set[int]:
+        """
+        Get the subset of song IDs that exist in the catalog.
+        
+        Args:
+            db: Database connection
+            song_ids: Song IDs to look up
+            
+        Returns:
+            Set of IDs that were found
+        """
+        if not song_ids:
+            return set()
+        
+        # Bind the IDs as one JSON array so the SQL text (and its cached
+        # prepared statement) is the same whatever the playlist length
+        rows = db.execute(
+            "SELECT id FROM songs WHERE id IN (SELECT value FROM json_each(?))",
+            (orjson.dumps(list(song_ids)).decode(),)
+        )
+        return {row[0] for row in rows}
     
     @staticmethod
     def search_song_by_name(db: sqlite3.Connection, name: str) -> Optional[Dict[str, Any]]:
-        """Search for song by partial name match."""
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        cursor.execute("SELECT * FROM songs WHERE title LIKE ? LIMIT 1", (f'%{name}%',))
-        return cursor.fetchone()
+        """
+        Search for song by partial name match.
+        
+        Title words are matched by prefix through the full-text index; if
+        that finds nothing (or FTS5 is unavailable) a substring LIKE match
+        is used instead. The match is returned from the in-memory catalog.
+        
+        Args:
+            db: Database connection
+            name: Full or partial song title
+            
+        Returns:
+            Best matching song or None if not found
+        """
+        words = re.findall(r"\w+", name)
+        if words:
+            match = " ".join(f'title:"{word}"*' for word in words)
+            try:
+                row = db.execute(
+                    "SELECT rowid FROM songs_fts WHERE songs_fts MATCH ? ORDER BY rank LIMIT 1",
+                    (match,)
+                ).fetchone()
+                song = catalog.get_song(db, row[0]) if row else None
+                if song:
+                    return song
+            except sqlite3.OperationalError:
+                pass
+        
+        row = db.execute("SELECT id FROM songs WHERE title LIKE ? LIMIT 1", (f'%{name}%',)).fetchone()
+        return catalog.get_song(db, row[0]) if row else None
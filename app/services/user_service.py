@@ -3,8 +3,6 @@
 import sqlite3
 from typing import Optional, Dict, Any
 
-from ..database import dict_factory
-
 
 class UserService:
     """Service for user operations."""
@@ -21,23 +19,18 @@ class UserService:
         Returns:
             User dict
         """
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        
         # Check if user exists
-        cursor.execute("SELECT * FROM users WHERE name = ?", (name,))
-        user = cursor.fetchone()
+        user = db.execute("SELECT * FROM users WHERE name = ?", (name,)).fetchone()
         
         if user:
             return user
         
         # Create new user
-        cursor.execute("INSERT INTO users (name) VALUES (?)", (name,))
+        db.execute("INSERT INTO users (name) VALUES (?)", (name,))
         db.commit()
         
         # Get the new user
-        cursor.execute("SELECT * FROM users WHERE name = ?", (name,))
-        user = cursor.fetchone()
+        user = db.execute("SELECT * FROM users WHERE name = ?", (name,)).fetchone()
         
         return user
     
@@ -53,7 +46,18 @@ class UserService:
         Returns:
             User dict or None if not found
         """
-        cursor = db.cursor()
-        cursor.row_factory = dict_factory
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        return cursor.fetchone()
+        return db.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
+    
+    @staticmethod
+    def user_exists(db: sqlite3.Connection, user_id: int) -> bool:
+        """
+        Check whether a user exists without fetching the row.
+        
+        Args:
+            db: Database connection
+            user_id: User ID
+            
+        Returns:
+            True if the user exists
+        """
+        return db.execute("SELECT 1 FROM users WHERE id = ?", (user_id,)).fetchone() is not None
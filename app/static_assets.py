@@ -0,0 +1,50 @@
+"""Cache-busting URLs and long-lived caching for static files."""
+
+import hashlib
+import os
+from functools import lru_cache
+
+from flask import request
+
+# Versioned URLs change whenever the file does, so browsers may keep them
+STATIC_MAX_AGE = 31536000
+
+
+@lru_cache(maxsize=None)
+def static_version(static_folder, filename):
+    """
+    Get a short content hash for a static file.
+    
+    Args:
+        static_folder: App static folder
+        filename: File path relative to the static folder
+        
+    Returns:
+        Hex digest prefix, or an empty string if the file does not exist
+    """
+    try:
+        with open(os.path.join(static_folder, filename), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()[:12]
+    except OSError:
+        return ""
+
+
+def init_static(app):
+    """Version static URLs by content and cache versioned responses for a year."""
+    
+    @app.url_defaults
+    def add_static_version(endpoint, values):
+        """Append ?v=<content hash> to url_for('static', ...) URLs."""
+        if endpoint == "static" and "v" not in values:
+            version = static_version(app.static_folder, values["filename"])
+            if version:
+                values["v"] = version
+    
+    @app.after_request
+    def cache_versioned_static(response):
+        """Mark versioned static responses as immutable for a year."""
+        if request.endpoint == "static" and "v" in request.args and response.status_code == 200:
+            response.cache_control.public = True
+            response.cache_control.max_age = STATIC_MAX_AGE
+            response.cache_control.immutable = True
+        return response
@@ -0,0 +1,8 @@
+"""Gunicorn hooks for multiprocess Prometheus metrics."""
+
+from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
+
+
+def child_exit(server, worker):
+    """Drop the live samples of a worker that has exited."""
+    GunicornInternalPrometheusMetrics.mark_process_dead_on_child_exit(worker.pid)
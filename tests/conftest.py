@@ -1,39 +1,84 @@
 """Pytest configuration and fixtures."""
 
 import os
+import sqlite3
 import tempfile
 import pytest
 from pathlib import Path
 
 from app import create_app
-from app.database import init_db
+from app.database import close_pool, get_pool, init_db
+
+
+@pytest.fixture(scope="session")
+def seeded_db(tmp_path_factory):
+    """Build and seed a template database once per test session."""
+    db_path = str(tmp_path_factory.mktemp("template") / "playlist.db")
+    init_db(db_path)
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def shared_app():
+    """Create the test app once; each test points it at its own database."""
+    os.environ["APP_ENV"] = "test"
+    
+    app = create_app("test")
+    app.config.update({"TESTING": True})
+    return app
 
 
 @pytest.fixture
-def app():
+def app(shared_app, seeded_db):
     """Create and configure a test app instance."""
     # Create a temporary file for the test database
     db_fd, db_path = tempfile.mkstemp()
     
-    # Set environment for test config
-    os.environ["APP_ENV"] = "test"
-    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    # Start from a copy of the seeded template instead of rebuilding it
+    source = sqlite3.connect(seeded_db)
+    target = sqlite3.connect(db_path)
+    source.backup(target)
+    target.close()
+    source.close()
     
-    # Create app with test config
-    app = create_app("test")
-    app.config.update({
-        "TESTING": True,
-        "DATABASE_URL": f"sqlite:///{db_path}",
-    })
+    # Point the shared app at this test's database
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    shared_app.config["DATABASE_URL"] = f"sqlite:///{db_path}"
     
-    # Initialize database with seed data
+    # Load the catalog from the copy (already seeded, so this is cheap)
     init_db(db_path)
     
-    yield app
+    yield shared_app
     
-    # Cleanup
+    # Cleanup (including WAL side files left by pooled connections)
+    close_pool(db_path)
     os.close(db_fd)
-    os.unlink(db_path)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.unlink(db_path + suffix)
+
+
+@pytest.fixture
+def queries(app):
+    """
+    Record the SELECT statements run while serving requests.
+    
+    Requests take the most recently returned pooled connection, so tracing
+    the connection handed back last captures every query of a sequential
+    test client.
+    """
+    pool = get_pool(app.config["DATABASE_URL"][len("sqlite:///"):])
+    statements = []
+    
+    conn = pool.get()
+    conn.set_trace_callback(
+        lambda sql: statements.append(sql) if sql.lstrip().upper().startswith("SELECT") else None
+    )
+    pool.put(conn)
+    
+    yield statements
+    
+    conn.set_trace_callback(None)
 
 
 @pytest.fixture
@@ -49,13 +94,14 @@ def runner(app):
 
 
 @pytest.fixture
-def sample_user(client):
+def sample_user(app):
     """Create a sample user for testing."""
-    response = client.post(
-        "/api/users",
-        json={"name": "TestUser"}
-    )
-    return response.get_json()
+    from app.database import get_db
+    from app.services.user_service import UserService
+    
+    # Insert directly rather than through the API; user routes have their own tests
+    with app.app_context():
+        return dict(UserService.get_or_create_user(get_db(), "TestUser"))
 
 
 @pytest.fixture
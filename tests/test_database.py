@@ -0,0 +1,92 @@
+"""Tests for database connection handling."""
+
+import sqlite3
+
+import pytest
+
+from app.database import get_db, init_db
+from app.pool import ConnectionPool
+
+
+def test_connection_reused_across_requests(app):
+    """Test the same connection serves consecutive app contexts."""
+    with app.app_context():
+        first = get_db()
+    
+    with app.app_context():
+        second = get_db()
+    
+    assert first is second
+
+
+def test_uncommitted_work_discarded_on_teardown(app):
+    """Test teardown rolls back writes that were never committed."""
+    with app.app_context():
+        db = get_db()
+        db.execute("INSERT INTO users (name) VALUES (?)", ("Uncommitted",))
+        assert db.in_transaction
+    
+    with app.app_context():
+        db = get_db()
+        assert not db.in_transaction
+        row = db.execute("SELECT * FROM users WHERE name = ?", ("Uncommitted",)).fetchone()
+        assert row is None
+
+
+def test_connection_pragmas(app):
+    """Test request connections use WAL with relaxed syncing."""
+    with app.app_context():
+        db = get_db()
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 1 == NORMAL
+        assert db.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_pool_reuses_and_caps_idle_connections():
+    """Test the pool hands back the last returned connection and closes extras."""
+    pool = ConnectionPool(lambda: sqlite3.connect(":memory:"), maxsize=1)
+    first = pool.get()
+    second = pool.get()
+    assert first is not second
+    
+    pool.put(first)
+    pool.put(second)
+    assert pool.get() is first
+    
+    # The pool was full, so the second connection was closed
+    with pytest.raises(sqlite3.ProgrammingError):
+        second.execute("SELECT 1")
+
+
+def test_init_db_deduplicates_feedback(app):
+    """Test init_db keeps the latest answer when adding the unique index."""
+    db_path = app.config["DATABASE_URL"][len("sqlite:///"):]
+    
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP INDEX idx_feedback_unique")
+    conn.execute("INSERT INTO users (name) VALUES ('Dup')")
+    conn.executemany(
+        "INSERT INTO user_song_feedback (user_id, song_id, liked) VALUES (1, 1, ?)",
+        [(1,), (0,)]
+    )
+    conn.commit()
+    conn.close()
+    
+    init_db(db_path)
+    
+    with app.app_context():
+        rows = get_db().execute(
+            "SELECT liked FROM user_song_feedback WHERE user_id = 1 AND song_id = 1"
+        ).fetchall()
+    assert [row["liked"] for row in rows] == [0]
+
+
+def test_feedback_lookups_use_unique_index(app):
+    """Test per-user feedback lookups are served by the (user_id, song_id) index."""
+    with app.app_context():
+        plan = get_db().execute(
+            "EXPLAIN QUERY PLAN "
+            "SELECT song_id FROM user_song_feedback WHERE user_id = ? AND song_id = ?",
+            (1, 1)
+        ).fetchall()
+    assert "idx_feedback_unique" in plan[0]["detail"]
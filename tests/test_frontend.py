@@ -0,0 +1,48 @@
+"""Tests for frontend routes."""
+
+import pytest
+
+
+@pytest.mark.parametrize("path", ["/", "/quiz", "/generate", "/profile"])
+def test_frontend_page(client, path):
+    """Test frontend pages render as HTML and are stable across requests."""
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.mimetype == "text/html"
+    
+    assert client.get(path).data == response.data
+
+
+def test_frontend_page_not_modified(client):
+    """Test a page is answered with 304 when the client's ETag matches."""
+    etag = client.get("/").headers["ETag"]
+    
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+
+def test_static_assets_are_versioned(client):
+    """Test pages link content-versioned assets that are cached long-term."""
+    page = client.get("/").get_data(as_text=True)
+    assert "/static/retro.css?v=" in page
+    
+    url = page.split('href="', 1)[1].split('"', 1)[0]
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.cache_control.max_age == 31536000
+    assert response.cache_control.immutable
+    
+    # Unversioned URLs keep the default caching
+    assert not client.get("/static/retro.css").cache_control.immutable
+
+
+def test_frontend_pages_rendered_by_create_app():
+    """Test create_app renders every page, so a preloaded master shares them."""
+    from app import create_app
+    from app.routes import frontend
+    
+    frontend._render_page.cache_clear()
+    create_app("test")
+    
+    assert frontend._render_page.cache_info().currsize == len(frontend.PAGES)
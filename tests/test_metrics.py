@@ -1,6 +1,31 @@
 """Tests for metrics endpoint."""
 
 import pytest
+from prometheus_client import REGISTRY
+
+from app.database import close_pool
+
+
+@pytest.fixture(scope="module")
+def metrics_payload(shared_app, seeded_db):
+    """Scrape /metrics once, after some traffic, for the read-only format tests."""
+    # These requests only read, so the seeded template can serve them directly;
+    # the shared app is pointed back at its previous database straight after
+    database_url = shared_app.config["DATABASE_URL"]
+    shared_app.config["DATABASE_URL"] = f"sqlite:///{seeded_db}"
+    try:
+        client = shared_app.test_client()
+        
+        # Make a few requests to generate metrics
+        client.get("/health")
+        client.get("/api/songs")
+        
+        payload = client.get("/metrics").data.decode('utf-8')
+    finally:
+        shared_app.config["DATABASE_URL"] = database_url
+        close_pool(seeded_db)
+    
+    return payload
 
 
 def test_metrics_endpoint_exists(client):
@@ -9,32 +34,42 @@ def test_metrics_endpoint_exists(client):
     assert response.status_code == 200
 
 
-def test_metrics_endpoint_format(client):
+def test_metrics_endpoint_format(metrics_payload):
     """Test metrics endpoint returns Prometheus format."""
-    response = client.get("/metrics")
-    data = response.data.decode('utf-8')
+    data = metrics_payload
     
     # Check for Prometheus format indicators
     assert "# HELP" in data or "# TYPE" in data or "playlister" in data
 
 
-def test_metrics_includes_app_info(client):
+def test_metrics_includes_app_info(metrics_payload):
     """Test metrics includes app info."""
-    response = client.get("/metrics")
-    data = response.data.decode('utf-8')
+    data = metrics_payload
     
     # Should contain app_info metric
     assert "playlister_app_info" in data or "app_info" in data
 
 
-def test_metrics_includes_http_metrics(client):
+def test_metrics_includes_http_metrics(metrics_payload):
     """Test metrics includes HTTP request metrics."""
-    # Make a few requests to generate metrics
-    client.get("/health")
-    client.get("/api/songs")
-    
-    response = client.get("/metrics")
-    data = response.data.decode('utf-8')
+    data = metrics_payload.lower()
     
     # Should track requests
-    assert "http" in data.lower() or "request" in data.lower()
+    assert "http" in data or "request" in data
+
+
+def test_playlist_generate_counter(client, sample_user):
+    """Test playlist generation requests are counted by outcome."""
+    def count(success):
+        return REGISTRY.get_sample_value(
+            "playlister_playlist_generate_total",
+            {"success": success, "genre": "none"}
+        ) or 0
+    
+    successes, failures = count("true"), count("false")
+    
+    client.post("/api/playlists/generate", json={"user_id": sample_user["id"]})
+    client.post("/api/playlists/generate", json={"user_id": 99999})
+    
+    assert count("true") == successes + 1
+    assert count("false") == failures + 1
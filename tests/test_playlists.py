@@ -18,16 +18,19 @@ def test_generate_playlist_cold_start(client, sample_user):
 
 def test_generate_playlist_with_feedback(client, sample_user, sample_songs):
     """Test generating playlist with user feedback."""
-    # Submit some feedback first
-    for i, song in enumerate(sample_songs[:3]):
-        client.post(
-            "/api/quiz/answer",
-            json={
-                "user_id": sample_user["id"],
-                "song_id": song["id"],
-                "liked": i % 2 == 0  # Like every other song
-            }
+    from app.database import get_db
+    
+    # Record some feedback first, directly rather than through the quiz API
+    with client.application.app_context():
+        db = get_db()
+        db.executemany(
+            "INSERT INTO user_song_feedback (user_id, song_id, liked) VALUES (?, ?, ?)",
+            [
+                (sample_user["id"], song["id"], i % 2 == 0)  # Like every other song
+                for i, song in enumerate(sample_songs[:3])
+            ]
         )
+        db.commit()
     
     # Generate playlist
     response = client.post(
@@ -112,6 +115,34 @@ def test_create_playlist_invalid_song(client, sample_user):
     assert response.status_code == 404
 
 
+def test_create_playlist_partially_invalid_songs(client, sample_user, sample_songs):
+    """Test creating playlist where only some song IDs exist."""
+    response = client.post(
+        "/api/playlists",
+        json={
+            "user_id": sample_user["id"],
+            "name": "Test Playlist",
+            "song_ids": [sample_songs[0]["id"], 99999, sample_songs[1]["id"]]
+        }
+    )
+    assert response.status_code == 404
+    assert "99999" in response.get_json()["error"]
+
+
+@pytest.mark.parametrize("song_ids", [["abc"], ["1"], ["1.5"], [1.7], [True], 5])
+def test_create_playlist_malformed_song_ids(client, sample_user, song_ids):
+    """Test song IDs that are not JSON integers are rejected, not coerced."""
+    response = client.post(
+        "/api/playlists",
+        json={"user_id": sample_user["id"], "name": "Bad", "song_ids": song_ids}
+    )
+    assert response.status_code == 400
+    
+    # Nothing was saved
+    playlists = client.get(f"/api/playlists?user_id={sample_user['id']}").get_json()
+    assert playlists == []
+
+
 def test_get_user_playlists(client, sample_user, sample_songs):
     """Test getting user's playlists."""
     # Create a playlist first
@@ -134,6 +165,7 @@ def test_get_user_playlists(client, sample_user, sample_songs):
     assert len(data) > 0
     assert data[0]["name"] == "Test Playlist"
     assert "song_count" in data[0]
+    assert data[0]["song_count"] == 3
 
 
 def test_get_user_playlists_missing_user_id(client):
@@ -169,6 +201,11 @@ def test_get_playlist_detail(client, sample_user, sample_songs):
     for item in data["songs"]:
         assert "position" in item
         assert "song" in item
+    
+    # Songs come back in playlist order with their full details
+    assert [item["song"]["id"] for item in data["songs"]] == song_ids
+    assert [item["position"] for item in data["songs"]] == [1, 2, 3]
+    assert data["songs"][0]["song"]["title"] == sample_songs[0]["title"]
 
 
 def test_get_playlist_not_found(client):
@@ -198,12 +235,66 @@ def test_delete_playlist_success(client, sample_user, sample_songs):
     data = response.get_json()
     assert data["status"] == "success"
     
-    # Verify it's deleted
-    get_response = client.get(f"/api/playlists/{playlist_id}")
-    assert get_response.status_code == 404
+    # Verify it's deleted, and its songs went with it
+    from app.database import get_db
+    from app.services.playlist_service import PlaylistService
+    
+    with client.application.app_context():
+        db = get_db()
+        playlist = PlaylistService.get_playlist_by_id(db, playlist_id)
+        remaining = db.execute(
+            "SELECT COUNT(*) FROM playlist_songs WHERE playlist_id = ?", (playlist_id,)
+        ).fetchone()[0]
+    assert playlist is None
+    assert remaining == 0
 
 
 def test_delete_playlist_not_found(client):
     """Test deleting non-existent playlist."""
     response = client.delete("/api/playlists/99999")
     assert response.status_code == 404
+
+
+@pytest.mark.parametrize("length", [1, 5])
+def test_get_playlist_detail_query_count(client, queries, sample_user, sample_songs, length):
+    """Test playlist detail runs the same number of queries whatever its length."""
+    song_ids = [song["id"] for song in sample_songs[:length]]
+    playlist_id = client.post(
+        "/api/playlists",
+        json={"user_id": sample_user["id"], "name": "Counted", "song_ids": song_ids}
+    ).get_json()["playlist_id"]
+    
+    queries.clear()
+    response = client.get(f"/api/playlists/{playlist_id}")
+    assert len(response.get_json()["songs"]) == length
+    assert len(queries) == 1
+
+
+def test_get_user_playlists_query_count(client, queries, sample_user, sample_songs):
+    """Test listing playlists does not query once per playlist."""
+    for name in ("One", "Two", "Three"):
+        client.post(
+            "/api/playlists",
+            json={"user_id": sample_user["id"], "name": name, "song_ids": [sample_songs[0]["id"]]}
+        )
+    
+    queries.clear()
+    response = client.get(f"/api/playlists?user_id={sample_user['id']}")
+    assert len(response.get_json()) == 3
+    # User check plus one grouped playlist query
+    assert len(queries) == 2
+
+
+def test_get_playlist_by_id_without_songs(app, sample_user):
+    """Test a playlist with no songs is returned with an empty song list."""
+    from app.database import get_db
+    from app.services.playlist_service import PlaylistService
+    
+    with app.app_context():
+        db = get_db()
+        playlist_id = PlaylistService.create_playlist(db, sample_user["id"], "Empty", [])
+        playlist = PlaylistService.get_playlist_by_id(db, playlist_id)
+    
+    assert playlist["name"] == "Empty"
+    assert playlist["user_id"] == sample_user["id"]
+    assert playlist["songs"] == []
@@ -35,6 +35,41 @@ def test_start_quiz_default_count(client, sample_user):
     assert len(data) == 10
 
 
+def test_start_quiz_prefers_unrated_songs(app, client, sample_user):
+    """Test quiz tops up with rated songs only after unrated ones run out."""
+    from app.database import get_db
+    from app.services.quiz_service import QuizService
+    from app.services.song_service import SongService
+    
+    with app.app_context():
+        db = get_db()
+        song_ids = [song["id"] for song in SongService.get_all_songs(db)]
+        unrated_ids = set(song_ids[:3])
+        for song_id in song_ids[3:]:
+            QuizService.save_feedback(db, sample_user["id"], song_id, True)
+    
+    response = client.post(
+        "/api/quiz/start",
+        json={"user_id": sample_user["id"], "n": 5}
+    )
+    assert response.status_code == 200
+    
+    returned_ids = [song["id"] for song in response.get_json()]
+    assert len(returned_ids) == 5
+    assert len(set(returned_ids)) == 5
+    assert unrated_ids <= set(returned_ids)
+
+
+@pytest.mark.parametrize("n", [-1, "5", 2.5])
+def test_start_quiz_invalid_count(client, sample_user, n):
+    """Test starting quiz with a negative or non-integer count fails."""
+    response = client.post(
+        "/api/quiz/start",
+        json={"user_id": sample_user["id"], "n": n}
+    )
+    assert response.status_code == 400
+
+
 def test_start_quiz_missing_user_id(client):
     """Test starting quiz without user_id fails."""
     response = client.post("/api/quiz/start", json={"n": 5})
@@ -89,6 +124,15 @@ def test_answer_quiz_update_existing(client, sample_user, sample_songs):
     )
     assert response.status_code == 200
 
+    # The answer is replaced rather than duplicated
+    from app.database import get_db
+    from app.services.quiz_service import QuizService
+    
+    with client.application.app_context():
+        liked, disliked = QuizService.get_user_feedback(get_db(), sample_user["id"])
+    assert liked == []
+    assert [song["id"] for song in disliked] == [song_id]
+
 
 def test_answer_quiz_missing_fields(client, sample_user):
     """Test submitting quiz answer with missing fields."""
@@ -1,17 +1,34 @@
 """Unit tests for recommender service."""
 
+import os
+
 import pytest
-from app.services.recommender import RecommenderService
+from app.services.recommender import RecommenderService, _rng
 from app.config import Config
 
 
-@pytest.fixture
+# Ten-song catalogs shared by the generation tests; the recommender only
+# reads its inputs, so tests must not mutate these
+HOUSE_SONGS = [
+    {"id": i, "artist": f"Artist{i}", "subgenre": "house",
+     "year": 2020, "tags": "test", "bpm": 120}
+    for i in range(10)
+]
+
+MIXED_SONGS = [
+    {"id": i, "artist": f"Artist{i}", "subgenre": "deep-house" if i < 5 else "tech-house",
+     "year": 2020, "tags": "test", "bpm": 120}
+    for i in range(10)
+]
+
+
+@pytest.fixture(scope="module")
 def config():
-    """Get test configuration."""
+    """Get test configuration (shared, so tests must not mutate it)."""
     return Config()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def recommender(config):
     """Create recommender service instance."""
     return RecommenderService(config)
@@ -132,6 +149,15 @@ def test_score_song_bpm_proximity(recommender, liked_songs):
     assert score >= 0
 
 
+def test_build_profile_uses_median(recommender, liked_songs):
+    """Test BPM and year centres are medians, robust to an outlier."""
+    outlier = dict(liked_songs[0], id=7, bpm=174, year=1995)
+    profile = recommender.build_profile(liked_songs + [outlier], [])
+    
+    assert profile["median_bpm"] == 125
+    assert profile["median_year"] == 2019
+
+
 def test_score_song_era_proximity(recommender, liked_songs):
     """Test year proximity scoring."""
     song_similar_year = {
@@ -176,33 +202,36 @@ def test_score_song_determinism(recommender, sample_song, liked_songs):
     assert abs(score1 - score2) < 0.2
 
 
-def test_generate_recommendations_basic(recommender):
-    """Test basic recommendation generation."""
-    all_songs = [
-        {"id": i, "artist": f"Artist{i}", "subgenre": "house", 
-         "year": 2020, "tags": "test", "bpm": 120}
-        for i in range(10)
-    ]
+def test_score_songs_batch_matches_single(recommender, sample_song, liked_songs, disliked_songs):
+    """Test batch scoring agrees with per-song scoring (up to jitter)."""
+    other_song = dict(sample_song, id=9, artist="Disliked Artist", tags="dark")
+    songs = [sample_song, other_song]
     
+    batch_scores = recommender.score_songs(songs, liked_songs, disliked_songs)
+    
+    assert len(batch_scores) == 2
+    for song, batch_score in zip(songs, batch_scores, strict=True):
+        single_score = recommender.score_song(song, liked_songs, disliked_songs)
+        assert abs(batch_score - single_score) < 0.2
+    assert batch_scores[0] > batch_scores[1]
+
+
+@pytest.mark.parametrize("count", [3, 5, 10])
+def test_generate_recommendations_basic(recommender, count):
+    """Test basic recommendation generation."""
     recommendations = recommender.generate_recommendations(
-        all_songs, [], [], count=5
+        HOUSE_SONGS, [], [], count=count
     )
     
-    assert len(recommendations) == 5
+    assert len(recommendations) == count
 
 
 def test_generate_recommendations_excludes_disliked(recommender):
     """Test that disliked songs are excluded."""
-    all_songs = [
-        {"id": i, "artist": f"Artist{i}", "subgenre": "house", 
-         "year": 2020, "tags": "test", "bpm": 120}
-        for i in range(10)
-    ]
-    
-    disliked = [all_songs[0], all_songs[1]]
+    disliked = [HOUSE_SONGS[0], HOUSE_SONGS[1]]
     
     recommendations = recommender.generate_recommendations(
-        all_songs, [], disliked, count=5
+        HOUSE_SONGS, [], disliked, count=5
     )
     
     # Disliked songs should not be in recommendations
@@ -214,14 +243,8 @@ def test_generate_recommendations_excludes_disliked(recommender):
 
 def test_generate_recommendations_with_genre_preference(recommender):
     """Test recommendations with genre preference."""
-    all_songs = [
-        {"id": i, "artist": f"Artist{i}", "subgenre": "deep-house" if i < 5 else "tech-house", 
-         "year": 2020, "tags": "test", "bpm": 120}
-        for i in range(10)
-    ]
-    
     recommendations = recommender.generate_recommendations(
-        all_songs, [], [], count=5, preferred_genre="deep-house"
+        MIXED_SONGS, [], [], count=5, preferred_genre="deep-house"
     )
     
     # Should prioritize deep-house songs
@@ -230,27 +253,15 @@ def test_generate_recommendations_with_genre_preference(recommender):
 
 def test_cold_start_playlist_random(recommender):
     """Test cold start playlist generation."""
-    all_songs = [
-        {"id": i, "artist": f"Artist{i}", "subgenre": "house", 
-         "year": 2020, "tags": "test", "bpm": 120}
-        for i in range(10)
-    ]
-    
-    playlist = recommender.generate_cold_start_playlist(all_songs, count=5)
+    playlist = recommender.generate_cold_start_playlist(HOUSE_SONGS, count=5)
     
     assert len(playlist) == 5
 
 
 def test_cold_start_playlist_with_genre(recommender):
     """Test cold start with genre preference."""
-    all_songs = [
-        {"id": i, "artist": f"Artist{i}", "subgenre": "deep-house" if i < 5 else "tech-house", 
-         "year": 2020, "tags": "test", "bpm": 120}
-        for i in range(10)
-    ]
-    
     playlist = recommender.generate_cold_start_playlist(
-        all_songs, count=5, preferred_genre="deep-house"
+        MIXED_SONGS, count=5, preferred_genre="deep-house"
     )
     
     assert len(playlist) == 5
@@ -271,11 +282,14 @@ def test_cold_start_insufficient_genre_songs(recommender):
     
     # Should get 5 songs total (2 deep-house + 3 others)
     assert len(playlist) == 5
+    assert [s["id"] for s in playlist[:2]] == [0, 1]
+    assert len({s["id"] for s in playlist}) == 5
 
 
-def test_recommender_uses_configurable_weights(config):
+def test_recommender_uses_configurable_weights():
     """Test that recommender uses configurable weights."""
-    # Modify config weights
+    # Modify weights on a private config, not the shared fixture
+    config = Config()
     config.ARTIST_WEIGHT = 10.0
     recommender = RecommenderService(config)
     
@@ -301,3 +315,22 @@ def test_recommender_uses_configurable_weights(config):
     
     # Should have high score due to large artist weight
     assert score >= 10.0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_rng_reseeded_in_forked_child():
+    """Test forked workers do not share the parent's jitter/sampling state."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, repr(_rng.random()).encode())
+        finally:
+            os._exit(0)
+    
+    os.close(write_fd)
+    child_value = float(os.read(read_fd, 64))
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    
+    assert child_value != _rng.random()
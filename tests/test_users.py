@@ -58,3 +58,33 @@ def test_create_user_empty_name(client):
     
     data = response.get_json()
     assert "error" in data
+
+
+def test_create_user_malformed_json(client):
+    """Test creating user with a malformed JSON body fails cleanly."""
+    response = client.post(
+        "/api/users",
+        data="{not json",
+        content_type="application/json"
+    )
+    assert response.status_code == 400
+    
+    data = response.get_json()
+    assert "error" in data
+
+
+def test_create_user_non_object_json(client):
+    """Test creating user with a JSON body that is not an object fails."""
+    response = client.post("/api/users", json=["NewUser"])
+    assert response.status_code == 400
+
+
+def test_user_exists(app, sample_user):
+    """Test the user existence check."""
+    from app.database import get_db
+    from app.services.user_service import UserService
+    
+    with app.app_context():
+        db = get_db()
+        assert UserService.user_exists(db, sample_user["id"])
+        assert not UserService.user_exists(db, 99999)